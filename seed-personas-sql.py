@@ -4,10 +4,15 @@ Generate SQL INSERT statements for seeding council personas from YAML files.
 """
 import yaml
 import json
-import os
 import sys
 from pathlib import Path
 
+# Prefer the libyaml C bindings when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 PERSONALITIES_DIR = Path('/root/apps/accordant/xmarkdigest/packages/council/resources/personalities')
 
 def escape_sql_string(s):
@@ -60,22 +65,25 @@ def main():
     sql_statements = []
     files = sorted([f for f in PERSONALITIES_DIR.glob('*.yaml') if f.name != 'system-prompts.yaml'])
     
-    print(f"-- Generated SQL for seeding {len(files)} council personas")
-    print(f"-- Generated from: {PERSONALITIES_DIR}\n")
+    # Buffer all output and write it once at the end
+    out = [
+        f"-- Generated SQL for seeding {len(files)} council personas\n",
+        f"-- Generated from: {PERSONALITIES_DIR}\n\n",
+    ]
     
     for yaml_file in files:
         try:
-            with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(yaml_file.read_bytes(), Loader=SafeLoader)
             
             if data.get('id'):
                 sql = generate_persona_sql(data)
                 sql_statements.append(sql)
-                print(f"-- Persona: {data.get('name')} ({data.get('id')})")
+                out.append(f"-- Persona: {data.get('name')} ({data.get('id')})\n")
         except Exception as e:
             print(f"-- Error processing {yaml_file.name}: {e}", file=sys.stderr)
     
-    print("\n".join(sql_statements))
+    out.append("\n".join(sql_statements) + "\n")
+    sys.stdout.write("".join(out))
 
 if __name__ == '__main__':
     main()
@@ -7,6 +7,12 @@ import json
 import sys
 from pathlib import Path
 
+# Prefer the libyaml C bindings when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 SYSTEM_PROMPTS_FILE = Path('/root/apps/accordant/xmarkdigest/packages/council/resources/personalities/system-prompts.yaml')
 
 def escape_sql_string(s):
@@ -52,11 +58,13 @@ def main():
         print(f"Error: File not found: {SYSTEM_PROMPTS_FILE}", file=sys.stderr)
         sys.exit(1)
     
-    with open(SYSTEM_PROMPTS_FILE, 'r') as f:
-        data = yaml.safe_load(f)
+    data = yaml.load(SYSTEM_PROMPTS_FILE.read_bytes(), Loader=SafeLoader)
     
-    print(f"-- Generated SQL for seeding system prompts")
-    print(f"-- Generated from: {SYSTEM_PROMPTS_FILE}\n")
+    # Buffer all output and write it once at the end
+    out = [
+        "-- Generated SQL for seeding system prompts\n",
+        f"-- Generated from: {SYSTEM_PROMPTS_FILE}\n\n",
+    ]
     
     sql_statements = []
     
@@ -71,7 +79,7 @@ def main():
             model = None
         sql = generate_prompt_sql('council_base_system_prompt', template, ['query', 'context'], model)
         sql_statements.append(sql)
-        print("-- System Prompt: council_base_system_prompt")
+        out.append("-- System Prompt: council_base_system_prompt\n")
     
     # Ranking Prompt
     if data.get('ranking_prompt'):
@@ -89,7 +97,7 @@ def main():
             model
         )
         sql_statements.append(sql)
-        print("-- System Prompt: council_ranking_prompt")
+        out.append("-- System Prompt: council_ranking_prompt\n")
     
     # Chairman Prompt
     if data.get('chairman', {}).get('prompt'):
@@ -100,7 +108,7 @@ def main():
             data['chairman'].get('model')
         )
         sql_statements.append(sql)
-        print("-- System Prompt: council_chairman_prompt")
+        out.append("-- System Prompt: council_chairman_prompt\n")
     
     # Title Generation Prompt
     if data.get('title_generation', {}).get('prompt'):
@@ -111,9 +119,10 @@ def main():
             data['title_generation'].get('model')
         )
         sql_statements.append(sql)
-        print("-- System Prompt: council_title_generation")
+        out.append("-- System Prompt: council_title_generation\n")
     
-    print("\n".join(sql_statements))
+    out.append("\n".join(sql_statements) + "\n")
+    sys.stdout.write("".join(out))
 
 if __name__ == '__main__':
     main()